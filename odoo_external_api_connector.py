@@ -1,5 +1,260 @@
 import xmlrpc.client as xc
-import re
+import http.client
+import asyncio
+import concurrent.futures
+import urllib.parse
+import time
+import json
+import hashlib
+import threading
+import collections
+import os
+import weakref
+
+
+#seconds a granted model access right is trusted without asking the server again
+PERMISSION_CACHE_TTL = 300
+
+#metadata models which access rights are trusted until invalidate() is called
+_STATIC_MODELS = frozenset(('ir.model', 'ir.model.fields', 'res.users'))
+
+#errors raised by a failed call to the server: faults, http and network errors
+_RPC_ERRORS = (xc.Error, http.client.HTTPException, OSError)
+
+#fault code of odoo.exceptions.AccessError reported by the Odoo xmlrpc endpoints
+_ACCESS_ERROR_FAULT = 4
+
+
+def _x_name(name:str) -> str:
+    """
+    Returns the name prefixed with 'x_' as required by Odoo for custom models and fields.
+    """
+    return name if name.startswith("x_") else "x_" + name
+
+
+def _values_hash(values:dict) -> bytes:
+    """
+    Returns a digest of the canonical JSON dump of field values.
+    """
+    dump = json.dumps(values, sort_keys=True, default=str)
+    return hashlib.blake2b(dump.encode("utf-8"), digest_size=16).digest()
+
+
+def _changed_ids(records:list, fields:dict) -> list:
+    """
+    Returns ids of records read from the server which values differ from the fields
+    values to be written. Many2one values read as [id, name] are compared by id.
+    """
+    target = _values_hash(fields)
+    changed = []
+    for record in records:
+        current = {}
+        for name, value in fields.items():
+            current_value = record.get(name)
+            if isinstance(current_value, list) and len(current_value) == 2 \
+                    and isinstance(value, int) and not isinstance(value, bool):
+                current_value = current_value[0]
+            current[name] = current_value
+        if _values_hash(current) != target:
+            changed.append(record["id"])
+    return changed
+
+
+async def _xmlrpc_call_async(url:str, method:str, params:tuple):
+    """
+    Sends a single XML-RPC call to the url using asyncio streams and returns
+    its result. Raises xmlrpc.client.Fault or xmlrpc.client.ProtocolError
+    if the call failed.
+    """
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        raise OSError("unsupported XML-RPC protocol")
+    secure = parts.scheme == "https"
+    body = xc.dumps(params, method).encode("utf-8", "xmlcharrefreplace")
+    host = parts.netloc.rpartition("@")[2]
+    request = ("POST {} HTTP/1.0\r\nHost: {}\r\nUser-Agent: {}\r\n"
+               "Content-Type: text/xml\r\nContent-Length: {}\r\n\r\n").format(
+                   parts.path or "/RPC2", host, xc.Transport.user_agent, len(body))
+    reader, writer = await asyncio.open_connection(
+        parts.hostname, parts.port or (443 if secure else 80), ssl=True if secure else None)
+    try:
+        writer.write(request.encode("latin-1") + body)
+        await writer.drain()
+        response = await reader.read()
+    finally:
+        writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    status = head.split(b"\r\n", 1)[0].split(None, 2)
+    if len(status) < 2 or status[1] != b"200":
+        raise xc.ProtocolError(host + parts.path, int(status[1]) if len(status) > 1 else 0,
+                               status[2].decode("latin-1") if len(status) > 2 else "", {})
+    return xc.loads(payload)[0][0]
+
+
+def _run_coroutine(coro):
+    """
+    Runs a coroutine to completion from synchronous code. If an event loop is
+    already running in the current thread the coroutine is run in a separate one.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class _KeepAliveMixin:
+    """
+    Guards the HTTP/1.1 connection kept open by xmlrpc.client transports
+    with a lock, so that requests and close_all() called from different
+    threads don't use it at the same time.
+    """
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._lock = threading.RLock()
+
+    def request(self, host, handler, request_body, verbose=False):
+        with self._lock:
+            return super().request(host, handler, request_body, verbose)
+
+    def close_all(self) -> None:
+        """
+        Closes the connection kept open by the transport.
+        """
+        with self._lock:
+            self.close()
+
+
+class KeepAliveTransport(_KeepAliveMixin, xc.Transport):
+    """
+    xmlrpc.client.Transport reusing a persistent HTTP connection.
+    """
+
+
+class KeepAliveSafeTransport(_KeepAliveMixin, xc.SafeTransport):
+    """
+    xmlrpc.client.SafeTransport reusing a persistent HTTPS connection.
+    """
+
+
+class JsonRpcTransport:
+    """
+    Sends Odoo service calls to the /jsonrpc endpoint of the server over
+    a persistent HTTP(S) connection. Server errors are raised as
+    xmlrpc.client.Fault, HTTP errors as xmlrpc.client.ProtocolError and
+    malformed responses as xmlrpc.client.ResponseError, so callers handle
+    both protocols the same way.
+    """
+    def __init__(self, url:str) -> None:
+        parts = urllib.parse.urlsplit(url)
+        #unsupported protocol is reported by the first call like in xmlrpc mode
+        self._connection_class = {"http": http.client.HTTPConnection,
+                                  "https": http.client.HTTPSConnection}.get(parts.scheme)
+        self._host = parts.netloc
+        self._path = parts.path.rstrip("/") + "/jsonrpc"
+        self._connection = None
+        self._request_id = 0
+        self._lock = threading.RLock()
+
+    def call(self, service:str, method:str, args:list):
+        """
+        Calls the method of Odoo service ('common', 'object' or 'db') and
+        returns its result.
+        """
+        if self._connection_class is None:
+            raise OSError("unsupported JSON-RPC protocol")
+        with self._lock:
+            self._request_id += 1
+            payload = json.dumps({
+                "jsonrpc": "2.0",
+                "method": "call",
+                "params": {"service": service, "method": method, "args": args},
+                "id": self._request_id,
+                }).encode("utf-8")
+            #a kept-alive connection may have been closed by the server meanwhile
+            for retry in (False, True):
+                reused = self._connection is not None
+                if not reused:
+                    self._connection = self._connection_class(self._host)
+                try:
+                    self._connection.request("POST", self._path, payload,
+                                             {"Content-Type": "application/json"})
+                    response = self._connection.getresponse()
+                    body = response.read()
+                    break
+                except (ConnectionError, http.client.HTTPException):
+                    self._connection.close()
+                    self._connection = None
+                    if retry or not reused:
+                        raise
+        if response.status != 200:
+            raise xc.ProtocolError(self._host + self._path, response.status, response.reason,
+                                   dict(response.getheaders()))
+        #a proxy or maintenance page may answer with something else than JSON-RPC
+        try:
+            result = json.loads(body)
+        except ValueError:
+            result = None
+        if not isinstance(result, dict):
+            raise xc.ResponseError("invalid JSON-RPC response")
+        if result.get("error"):
+            error = result["error"]
+            data = error.get("data") or {}
+            #same fault code as xmlrpc so that callers check a single value
+            code = _ACCESS_ERROR_FAULT if data.get("name") == "odoo.exceptions.AccessError" \
+                else error.get("code", 0)
+            raise xc.Fault(code, "{}: {}".format(
+                data.get("name", "Error"), data.get("message", error.get("message"))))
+        return result.get("result")
+
+    def close(self) -> None:
+        """
+        Closes the connection kept open by the transport.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class _MultiCall:
+    """
+    Queues execute_kw calls and sends them through the connector when called,
+    in one system.multicall request or sequentially if the server doesn't
+    support it. Like xmlrpc.client.MultiCall, returns an iterator over the
+    results raising xmlrpc.client.Fault for failed calls.
+    """
+    def __init__(self, connector, proxy) -> None:
+        self._connector = connector
+        self._proxy = proxy
+        self._calls = []
+
+    def execute_kw(self, *params) -> None:
+        self._calls.append(params)
+
+    def __call__(self) -> xc.MultiCallIterator:
+        results = self._connector._run_multicall(self._proxy, self._calls)
+        return xc.MultiCallIterator([
+            {'faultCode': res.faultCode, 'faultString': res.faultString}
+            if isinstance(res, xc.Fault) else [res]
+            for res in results
+            ])
+
+
+class _JsonRpcProxy:
+    """
+    ServerProxy counterpart calling methods of an Odoo service through
+    JsonRpcTransport.
+    """
+    def __init__(self, transport:JsonRpcTransport, service:str) -> None:
+        self._transport = transport
+        self._service = service
+
+    def __getattr__(self, method:str):
+        if method.startswith("_"):
+            raise AttributeError(method)
+        return lambda *args: self._transport.call(self._service, method, list(args))
 
 
 # Implementation of access to Odoo server external API. Oficial documentation:
@@ -23,38 +278,63 @@ class odooExternalApiConnector:
                     Default to None.
                     - password (optional[str]) - password for authentication on the Odoo server.
                     Default to None.
+                    - token_cache_path (optional[str]) - directory to persist database name and UID
+                    in between processes, so that a new instance skips authentication if they
+                    are still valid. Default to None (not persisted).
+                    - transport (optional[str]) - protocol of synchronous calls, 'xmlrpc' or
+                    'jsonrpc'. JSON responses are smaller and faster to parse, but multicall
+                    is not available. Default to 'xmlrpc'.
     Methods (see detailed information in the description of the respective method):
     odooExternalApiConnector.get_ids(
-        self, model_name=None, filter=[], offset=None, limit=None
+        self, model_name=None, filter=None, offset=None, limit=None, multicall=None
         ) -> dict
     odooExternalApiConnector.get_records(
-        self, model_name=None, filter=[], offset=None, limit=None, fields=[]
+        self, model_name=None, filter=None, offset=None, limit=None, fields=None, multicall=None
+        ) -> dict
+    odooExternalApiConnector.iter_records(
+        self, model_name=None, filter=None, fields=None, page_size=1000
         ) -> dict
     odooExternalApiConnector.get_count(
-        self, model_name=None, filter=[], offset=None, limit=None
+        self, model_name=None, filter=None, offset=None, limit=None, multicall=None
         ) -> dict
     odooExternalApiConnector.get_fields(
-        self, model_name=None, attributes=['string', 'help', 'type']
+        self, model_name=None, attributes=None, multicall=None
         ) -> dict
     odooExternalApiConnector.create_record(
-        self, model_name=None, fields={}
+        self, model_name=None, fields=None
         ) -> dict
     odooExternalApiConnector.update_record(
-        self, model_name=None, ids=[], fields={}
+        self, model_name=None, ids=None, fields=None, compare_before_write=False
         ) -> dict
     odooExternalApiConnector.delete_record(
-        self, model_name=None, ids=[]
+        self, model_name=None, ids=None
         ) -> dict
     odooExternalApiConnector.create_model(
-        self, model_name=None, fields=[dict]
+        self, model_name=None, fields=None
         ) -> dict
+    Coroutine versions of the methods above, taking the same parameters except
+    multicall and returning the same dictionaries:
+    odooExternalApiConnector.aget_ids(...), .aget_records(...), .aiter_records(...), .aget_count(...),
+    .aget_fields(...), .acreate_record(...), .aupdate_record(...), .adelete_record(...)
+    odooExternalApiConnector.get_multicall(self) -> dict
+    odooExternalApiConnector.batch(self, calls=None) -> dict
+    odooExternalApiConnector.invalidate(self) -> None
+    odooExternalApiConnector.close(self) -> None
     All methods return a dictionary in a form {
         'error': 'error message'|None,
         <key1>: <value>|None|0,
         ...
         }.
     """
-    def __init__(self, url=None, host=None, db=None, username=None, password=None) -> None:
+    __slots__ = (
+        'url', 'host', 'db', 'username', 'password', 'uid', '_auth_db', '_host_url',
+        '_common_url', '_object_url', '_db_url', '_jsonrpc', '_local',
+        '_transports', '_server_version', '_multicall',
+        '_perm_cache', '_token_path', '_auth_task', '_lock',
+        )
+
+    def __init__(self, url=None, host=None, db=None, username=None, password=None,
+                 token_cache_path=None, transport='xmlrpc') -> None:
         #full url path to odoo server instance as String
         self.url = url
         #'[hostname]:[port]' alternative to url
@@ -69,98 +349,418 @@ class odooExternalApiConnector:
         self.password = password
         #uid of created connection
         self.uid = None
-
-    def _get_host(self) -> str:
-        """
-        Returns host url of Odoo server.
-        """
-        return self.url if self.url else self.host
+        #database the cached uid belongs to
+        self._auth_db = None
+        #host url of Odoo server: url if provided, host otherwise
+        self._host_url = url or self.host
+        #urls of Odoo external API endpoints
+        self._common_url = '{}/xmlrpc/2/common'.format(self._host_url)
+        self._object_url = '{}/xmlrpc/2/object'.format(self._host_url)
+        self._db_url = '{}/xmlrpc/db'.format(self._host_url)
+        if transport not in ('xmlrpc', 'jsonrpc'):
+            raise ValueError("Unsupported transport '{}'.".format(transport))
+        #calls are sent to /jsonrpc endpoint instead of /xmlrpc/2/*
+        self._jsonrpc = transport == 'jsonrpc'
+        #keep-alive transport and cached proxies to the 'common' and 'object'
+        #Odoo endpoints, one set per thread so that threads don't wait for each other
+        self._local = threading.local()
+        #transports of all live threads, closed by close()
+        self._transports = weakref.WeakSet()
+        #version information of the server, set on the first successful connection
+        self._server_version = None
+        #server accepts system.multicall, switched off after the first rejected attempt
+        self._multicall = not self._jsonrpc
+        #(model name, access scope) -> time the access was granted
+        self._perm_cache = {}
+        #file persisting database name and uid, one per server and username
+        self._token_path = None
+        if token_cache_path:
+            token_name = hashlib.md5((self._host_url + (username or "")).encode("utf-8")).hexdigest()
+            self._token_path = os.path.join(token_cache_path, token_name)
+        #authentication in progress awaited by concurrent coroutines
+        self._auth_task = None
+        #guards UID and permission cache of an instance shared between threads
+        self._lock = threading.RLock()
 
     def _create_connection(self) -> dict:
         """
         Creates a proxy connector to an Odoo server. Returns error if connection attempt
         was unsuccessful. Returns connection object and the server version information
-        if succeed.
+        if succeed. Error message contains repr() of the exception raised.
         """
         try:
-            conn = xc.ServerProxy('{}/xmlrpc/2/common'.format(self._get_host()))
+            conn = self._get_common_proxy()
             ver = conn.version()
-        except:
-            return {"error": "Can't connect to Odoo server.", "conn": None, "version": None}
+        except _RPC_ERRORS as err:
+            return {"error": "Can't connect to Odoo server: {!r}".format(err), "conn": None, "version": None}
         return {"error": None, "conn": conn, "version": ver}
 
     def _get_db_name(self) -> list:
         """
         Returns a list of names of databases existing on the Odoo server.
         """
-        db_serv_url = '{}/xmlrpc/db'.format(self._get_host())
-        sock = xc.ServerProxy(db_serv_url)
+        sock = self._make_proxy(self._db_url, 'db')
         return sock.list()
         
     def _authenticate(self) -> dict:
         """Authenticates on the Odoo server database. Uses database name provided
         or connects to the first database found on the server accepting provided
-        credentials. Sets UID value. Returns connected database and error if any.
+        credentials. Sets UID value. Returns connected database, UID and error if any.
+        UID and database are cached, subsequent calls don't hit the server until
+        invalidate() is called. If token_cache_path was provided, UID persisted
+        by a previous instance is reused after checking it is still valid.
+        """
+        uid, db = self.uid, self._auth_db
+        if uid and db:
+            return {"error": None, "db": db, "uid": uid}
+        with self._lock:
+            return self._authenticate_request()
+
+    def _authenticate_request(self) -> dict:
         """
+        Authenticates on the Odoo server unless another thread has done it
+        while the lock was awaited. Called with the instance lock held.
+        """
+        if self.uid and self._auth_db:
+            return {"error": None, "db": self._auth_db, "uid": self.uid}
+        if self._token_path and self._load_token():
+            return {"error": None, "db": self._auth_db, "uid": self.uid}
         connected_db = None
-        connection = self._create_connection()
-        error = connection["error"]
+        error = None
+        if self._server_version is None:
+            connection = self._create_connection()
+            error = connection["error"]
+            self._server_version = connection["version"]
         if error is None:
-            conn = connection["conn"]
+            conn = self._get_common_proxy()
             if self.db:
                 try:
                     self.uid = conn.authenticate(self.db, self.username, self.password, {})
                     connected_db = self.db
-                except:
-                    error = "Can't connect to the database using credentials provided."
+                except _RPC_ERRORS as err:
+                    error = "Can't connect to the database using credentials provided: {!r}".format(err)
             else:
-                dbs = self._get_db_name()
-                if dbs != []:
-                    for db in dbs:
-                        try:
-                            self.uid = conn.authenticate(db, self.username, self.password, {})
-                            error = None
-                            connected_db = db
-                            break
-                        except:
-                            error = "Can't connect to the database using credentials provided."
-                            continue
+                try:
+                    dbs = self._get_db_name()
+                except _RPC_ERRORS as err:
+                    error = "Can't get the list of databases: {!r}".format(err)
                 else:
-                    error = "No database exists on the server."
+                    if dbs:
+                        connected_db, uid, err = _run_coroutine(self._authenticate_async(dbs))
+                        if connected_db:
+                            self.uid = uid
+                        elif err:
+                            error = "Can't connect to the database using credentials provided: {!r}".format(err)
+                        else:
+                            error = "Can't connect to the database using credentials provided."
+                    else:
+                        error = "No database exists on the server."
         
         if error:
-            return {"error": error, "db": connected_db}
-        
-        return {"error": None, "db": connected_db}
+            return {"error": error, "db": connected_db, "uid": None}
+
+        if self.uid:
+            self._auth_db = connected_db
+            if self._token_path:
+                self._save_token()
+        return {"error": None, "db": connected_db, "uid": self.uid}
+
+    def _load_token(self) -> bool:
+        """
+        Reads database name and UID persisted in the token cache file and checks
+        them with a cheap read of the user record. Sets UID and returns True
+        if they are valid.
+        """
+        db, uid = self._read_token()
+        if not uid:
+            return False
+        try:
+            self._get_object_proxy().execute_kw(db, uid, self.password, 'res.users', 'read',
+                                                [[uid], ['id']])
+        except _RPC_ERRORS:
+            return False
+        self.uid = uid
+        self._auth_db = db
+        return True
+
+    def _read_token(self) -> tuple:
+        """
+        Returns a tuple (database name, UID) persisted in the token cache file
+        or (None, None) if the file is missing, unreadable or made for another
+        database.
+        """
+        try:
+            with open(self._token_path, encoding="utf-8") as token_file:
+                token = json.load(token_file)
+            db, uid = token["db"], token["uid"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None, None
+        if not uid or (self.db and db != self.db):
+            return None, None
+        return db, uid
+
+    def _save_token(self) -> None:
+        """
+        Persists database name and UID to the token cache file readable by
+        the owner only. Failure to write the file is ignored.
+        """
+        try:
+            fd = os.open(self._token_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, "w", encoding="utf-8") as token_file:
+                json.dump({"db": self._auth_db, "uid": self.uid}, token_file)
+        except OSError:
+            pass
 
-    def _check_model_access(self, model_name:str, access_scope=['read']) -> dict:
+    async def _authenticate_async(self, dbs:list) -> tuple:
+        """
+        Tries provided credentials on all databases concurrently. Returns
+        a tuple (database name, UID, error) where database is the first one
+        in the list accepting the credentials, or (None, None, error) if none
+        did. Error is the last exception raised by an attempt, if any.
+        """
+        async def attempt(db):
+            try:
+                uid = await _xmlrpc_call_async(self._common_url, 'authenticate',
+                                               (db, self.username, self.password, {}))
+            except _RPC_ERRORS as err:
+                return None, err
+            return uid, None
+
+        attempts = [asyncio.ensure_future(attempt(db)) for db in dbs]
+        error = None
+        try:
+            #awaited in list order, so the result doesn't depend on response timing
+            for db, next_attempt in zip(dbs, attempts):
+                uid, err = await next_attempt
+                if uid:
+                    return db, uid, None
+                error = err or error
+        finally:
+            for pending in attempts:
+                pending.cancel()
+        return None, None, error
+
+    def close(self) -> None:
+        """
+        Closes connections to the server kept open by the instance. The next
+        call opens a new one.
+        """
+        with self._lock:
+            transports = list(self._transports)
+        for transport in transports:
+            if self._jsonrpc:
+                transport.close()
+            else:
+                transport.close_all()
+
+    def invalidate(self) -> None:
+        """
+        Drops cached UID so that the next call authenticates on the Odoo server
+        again. Use it when credentials were changed or the cached UID was rejected
+        by the server.
+        """
+        with self._lock:
+            self.uid = None
+            self._auth_db = None
+            self._perm_cache.clear()
+
+    def _check_model_access(self, model_name:str, access_scope=('read',)) -> dict:
         """
         Checks if an access to requested model is granted to provided credentials
         and access scope.
         Returns a proxy to requested model, database name and error if any.
+        All access rights of the scope are checked in a single request, granted
+        access is cached for PERMISSION_CACHE_TTL seconds.
         """
         error = None
         model = None
         auth = self._authenticate()
         if auth["error"] is None:
-            mod = xc.ServerProxy('{}/xmlrpc/2/object'.format(self._get_host()))
-            for access_right in access_scope:
-                try:
-                    perm_check = mod.execute_kw(auth["db"], self.uid, self.password, model_name, 
-                                                'check_access_rights', [access_right], 
-                                                {'raise_exception': False})
+            mod = self._get_object_proxy()
+            key = (model_name, tuple(access_scope))
+            if self._access_cached(key):
+                return {"error": None, "model": mod, "db": auth["db"], "uid": auth["uid"]}
+            calls = [(auth["db"], auth["uid"], self.password, model_name,
+                      'check_access_rights', [access_right], {'raise_exception': False})
+                     for access_right in access_scope]
+            try:
+                perm_checks = self._run_multicall(mod, calls)
+            except _RPC_ERRORS as err:
+                perm_checks = None
+                error = repr(err)
+            if perm_checks is not None:
+                for access_right, perm_check in zip(access_scope, perm_checks):
+                    if isinstance(perm_check, xc.Fault):
+                        error = "Username/password are not valid."
+                        break
                     if not perm_check:
                         error = "The model does not exist or you do not have a permission to '{}' it.".format(access_right)
                         break
-                    else:
-                        model = mod
-                except:
-                    error = "Username/password are not valid."
+                else:
+                    model = mod
+                    with self._lock:
+                        self._perm_cache[key] = time.monotonic()
         else:
             error = auth["error"]
-        return {"error": error, "model": model, "db": auth["db"]}
+        return {"error": error, "model": model, "db": auth["db"], "uid": auth["uid"]}
 
-    def get_ids(self, model_name=None, filter=[], offset=0, limit=0) -> dict:
+    def _get_common_proxy(self) -> xc.ServerProxy:
+        """
+        Returns a proxy to the Odoo common endpoint, creates it on the first call.
+        """
+        proxy = getattr(self._local, "common_proxy", None)
+        if proxy is None:
+            proxy = self._local.common_proxy = self._make_proxy(self._common_url, 'common')
+        return proxy
+
+    def _get_object_proxy(self) -> xc.ServerProxy:
+        """
+        Returns a proxy to the Odoo object endpoint, creates it on the first call.
+        """
+        proxy = getattr(self._local, "object_proxy", None)
+        if proxy is None:
+            proxy = self._local.object_proxy = self._make_proxy(self._object_url, 'object')
+        return proxy
+
+    def _get_transport(self):
+        """
+        Returns the keep-alive transport of the current thread, creates it on
+        the first call.
+        """
+        transport = getattr(self._local, "transport", None)
+        if transport is None:
+            if self._jsonrpc:
+                transport = JsonRpcTransport(self._host_url)
+            elif self._host_url.startswith("https"):
+                transport = KeepAliveSafeTransport()
+            else:
+                transport = KeepAliveTransport()
+            self._local.transport = transport
+            with self._lock:
+                self._transports.add(transport)
+            #the connection is closed when the thread is gone
+            weakref.finalize(threading.current_thread(),
+                             transport.close if self._jsonrpc else transport.close_all)
+        return transport
+
+    def _make_proxy(self, url:str, service:str):
+        """
+        Returns a proxy to the Odoo service using the transport of the current thread.
+        """
+        if self._jsonrpc:
+            return _JsonRpcProxy(self._get_transport(), service)
+        return xc.ServerProxy(url, transport=self._get_transport())
+
+    def _run_multicall(self, proxy:xc.ServerProxy, calls:list) -> list:
+        """
+        Sends a list of execute_kw parameters lists to the server in one
+        system.multicall request. Returns a list of results in the order of calls,
+        failed calls are represented by xmlrpc.client.Fault instances.
+        Falls back to sequential calls if the server rejects system.multicall.
+        """
+        if self._multicall and len(calls) > 1:
+            multicall = xc.MultiCall(proxy)
+            for params in calls:
+                multicall.execute_kw(*params)
+            try:
+                response = multicall()
+            except xc.Fault:
+                self._multicall = False
+            else:
+                results = []
+                for i in range(len(calls)):
+                    try:
+                        results.append(response[i])
+                    except xc.Fault as err:
+                        results.append(err)
+                return results
+        results = []
+        for params in calls:
+            try:
+                results.append(proxy.execute_kw(*params))
+            except xc.Fault as err:
+                results.append(err)
+        return results
+
+    def _execute_kw(self, cursor:dict, model_name:str, method:str, args:list,
+                    kwargs=None, multicall=None):
+        """
+        Calls a method of the model through the proxy of a cursor returned by
+        _check_model_access(). If a multicall object is provided the call is
+        queued in it and None is returned. Cached access rights of the model
+        are dropped if the server refuses the access.
+        """
+        proxy = cursor["model"] if multicall is None else multicall
+        params = [cursor["db"], cursor["uid"], self.password, model_name, method, args]
+        if kwargs is not None:
+            params.append(kwargs)
+        try:
+            return proxy.execute_kw(*params)
+        except xc.Fault as err:
+            if err.faultCode == _ACCESS_ERROR_FAULT:
+                self._drop_access_cache(model_name)
+            raise
+
+    def _access_cached(self, key:tuple) -> bool:
+        """
+        Returns True if the (model name, access scope) key was granted less than
+        PERMISSION_CACHE_TTL seconds ago. Access to metadata models doesn't expire.
+        """
+        granted = self._perm_cache.get(key)
+        if granted is None:
+            return False
+        return key[0] in _STATIC_MODELS or time.monotonic() - granted < PERMISSION_CACHE_TTL
+
+    def _drop_access_cache(self, model_name:str) -> None:
+        """
+        Removes cached access rights of the model.
+        """
+        with self._lock:
+            for key in [key for key in self._perm_cache if key[0] == model_name]:
+                del self._perm_cache[key]
+
+    def get_multicall(self) -> dict:
+        """
+        Returns multicall object bound to the Odoo object endpoint as the second
+        element and error message, if any, as the first element of a dictionary.
+        Pass it as 'multicall' argument to get_ids(), get_records(), get_count()
+        and get_fields() to queue the calls instead of executing them, then call
+        the multicall object to send all of them in one request (or one by one
+        if the server doesn't support system.multicall). It returns an iterator
+        over the results in the order of queuing, like xmlrpc.client.MultiCall.
+        """
+        auth = self._authenticate()
+        if auth["error"]:
+            return {"error": auth["error"], "multicall": None}
+        return {"error": None, "multicall": _MultiCall(self, self._get_object_proxy())}
+
+    def batch(self, calls=None) -> dict:
+        """
+        Executes several model methods in one request to the server. Returns
+        a list of results in the order of calls as the second element and error
+        message, if any, as the first element of a dictionary. Each result is
+        a dictionary {'error': 'error message'|None, 'result': <value>|None}.
+        Accepted parameters:
+        - calls:list[tuple] - a list of (model_name, method, args[, kwargs]) tuples,
+          e.g. ('res.partner', 'search_count', [[]]). Default to empty list.
+        """
+        if not calls:
+            return {"error": None, "results": []}
+        auth = self._authenticate()
+        if auth["error"]:
+            return {"error": auth["error"], "results": None}
+        params = [[auth["db"], auth["uid"], self.password] + list(call) for call in calls]
+        try:
+            results = self._run_multicall(self._get_object_proxy(), params)
+        except Exception as err:
+            return {"error": repr(err), "results": None}
+        return {"error": None, "results": [
+            {"error": repr(res), "result": None} if isinstance(res, xc.Fault)
+            else {"error": None, "result": res}
+            for res in results
+            ]}
+
+    def get_ids(self, model_name=None, filter=None, offset=0, limit=0, multicall=None) -> dict:
         """
         Returns dictionary with the list of active records ids for requested 
         model as the second element and error message as the first element 
@@ -172,22 +772,24 @@ class odooExternalApiConnector:
         - offset:int - number of a first record to be returned. 
           Default to the first existing record.
         - limit:int - max number of records to return. Default to all.
+        - multicall - multicall object returned by
+          get_multicall(). If provided the call is queued in it and None is
+          returned instead of the result. Default to None.
         """
         if model_name:
             cursor = self._check_model_access(model_name)
             if cursor["error"]:
                 return {"error": cursor["error"], "ids": None}
-            model = cursor["model"]
             try:
-                ids = model.execute_kw(cursor["db"], self.uid, self.password,
-                                        model_name, 'search', [filter], 
-                                        {'offset': offset, 'limit': limit})
+                ids = self._execute_kw(cursor, model_name, 'search', [filter or []],
+                                       {'offset': offset, 'limit': limit}, multicall)
                 return {"error": None, "ids": ids}
             except Exception as err:
                 return {"error": repr(err), "ids": None}
         return {"error": "Model name is required.", "ids": None}
         
-    def get_records(self, model_name=None, filter=[], offset=0, limit=0, fields=[]) -> dict:
+    def get_records(self, model_name=None, filter=None, offset=0, limit=0, fields=None,
+                    multicall=None) -> dict:
         """
         Returns dictionary with the list of records for requested model as
         the second element and error message as the first element if any.
@@ -199,28 +801,70 @@ class odooExternalApiConnector:
           Default to the first existing record.
         - limit:int - max number of records to return. Default to all.
         - fields:list - a list of fields to be returned for a record. 
-          Default to empty list.
+          Default to None (all fields).
+        - multicall - multicall object returned by
+          get_multicall(). If provided the call is queued in it and None is
+          returned instead of the result. Default to None.
         """
         if model_name:
             cursor = self._check_model_access(model_name)
             if cursor["error"]:
                 return {"error": cursor["error"], "records": None}
-            model = cursor["model"]
-            criteria = {
-                'offset': offset, 'limit': limit, 'fields': fields
-                }  if fields != [] else {
-                    'offset': offset, 'limit': limit
-                    }
+            criteria = {'offset': offset, 'limit': limit}
+            if fields:
+                criteria['fields'] = fields
             try:
-                records = model.execute_kw(cursor["db"], self.uid, self.password,
-                                            model_name, 'search_read', [filter],
-                                            criteria)
+                records = self._execute_kw(cursor, model_name, 'search_read', [filter or []],
+                                           criteria, multicall)
                 return {"error": None, "records": records}
             except Exception as err:
                 return {"error": repr(err), "records": None}
         return {"error": "Model name is required.", "records": None}
 
-    def get_count(self, model_name=None, filter=[]) -> dict:
+    def iter_records(self, model_name=None, filter=None, fields=None, page_size=1000) -> dict:
+        """
+        Returns dictionary with a generator of records for requested model as
+        the second element and error message as the first element if any.
+        Records are requested by pages of page_size records ordered by id, so
+        memory use doesn't depend on the number of records and iteration can
+        be stopped at any moment. Errors occurred while fetching the following
+        pages are raised by the generator.
+        Accepted parameters:
+        - model_name:str - name of a model. Required.
+        - filter:list[list] - Odoo's search domains as list of lists. 
+          Default to empty list.
+        - fields:list - a list of fields to be returned for a record. 
+          Default to None (all fields).
+        - page_size:int - number of records requested at once, a positive number.
+          Default to 1000.
+        """
+        if model_name:
+            if not isinstance(page_size, int) or page_size < 1:
+                return {"error": "Page size should be a positive number.", "records": None}
+            cursor = self._check_model_access(model_name)
+            if cursor["error"]:
+                return {"error": cursor["error"], "records": None}
+            return {"error": None, "records": self._iter_pages(cursor, model_name, filter,
+                                                               fields, page_size)}
+        return {"error": "Model name is required.", "records": None}
+
+    def _iter_pages(self, cursor:dict, model_name:str, filter, fields, page_size:int):
+        """
+        Yields records of the model requested page by page.
+        """
+        criteria = {'limit': page_size, 'order': 'id'}
+        if fields:
+            criteria['fields'] = fields
+        offset = 0
+        while True:
+            page = self._execute_kw(cursor, model_name, 'search_read', [filter or []],
+                                    dict(criteria, offset=offset))
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    def get_count(self, model_name=None, filter=None, multicall=None) -> dict:
         """
         Returns a number of active records matching criterias given for requested 
         model as the second element and error message as the first element 
@@ -232,21 +876,23 @@ class odooExternalApiConnector:
         - offset:int - number of a first record to be returned. 
           Default to the first existing record.
         - limit:int - max number of records to return. Default to all.
+        - multicall - multicall object returned by
+          get_multicall(). If provided the call is queued in it and None is
+          returned instead of the result. Default to None.
         """
         if model_name:
             cursor = self._check_model_access(model_name)
             if cursor["error"]:
                 return {"error": cursor["error"], "count": None}
-            model = cursor["model"]
             try:
-                records_count = model.execute_kw(cursor["db"], self.uid, self.password,
-                                        model_name, 'search_count', [filter])
+                records_count = self._execute_kw(cursor, model_name, 'search_count', [filter or []],
+                                                 multicall=multicall)
                 return {"error": None, "count": records_count}
             except Exception as err:
                 return {"error": repr(err), "count": None}
         return {"error": "Model name is required.", "count": None}
 
-    def get_fields(self, model_name=None, attributes=['string', 'help', 'type']) -> dict:
+    def get_fields(self, model_name=None, attributes=None, multicall=None) -> dict:
         """
         Returns a dictionary of fields with its specified attributes (as dict of dicts) 
         for requested model as the second element and error message as the first element 
@@ -255,22 +901,25 @@ class odooExternalApiConnector:
         - model_name:str - name of a model. Required.
         - attributes:list - a list of field's attribute to be retrieved. 
           Default to ['string', 'help', 'type'].
+        - multicall - multicall object returned by
+          get_multicall(). If provided the call is queued in it and None is
+          returned instead of the result. Default to None.
         """
         if model_name:
             cursor = self._check_model_access(model_name)
             if cursor["error"]:
                 return {"error": cursor["error"], "fields": None}
-            model = cursor["model"]
+            if attributes is None:
+                attributes = ['string', 'help', 'type']
             try:
-                fields = model.execute_kw(cursor["db"], self.uid, self.password,
-                                        model_name, 'fields_get', [], 
-                                        {'attributes': attributes})
+                fields = self._execute_kw(cursor, model_name, 'fields_get', [],
+                                          {'attributes': attributes}, multicall)
                 return {"error": None, "fields": fields}
             except Exception as err:
                 return {"error": repr(err), "fields": None}
         return {"error": "Model name is required.", "fields": None}
 
-    def create_record(self, model_name=None, fields={}) -> dict:
+    def create_record(self, model_name=None, fields=None) -> dict:
         """
         Creates a single new record of requested model using fields values provided
         as a dictionary of name-value pairs.
@@ -288,20 +937,18 @@ class odooExternalApiConnector:
             cursor = self._check_model_access(model_name, ['read', 'create'])
             if cursor["error"]:
                 return {"error": cursor["error"], "id": None}
-            model = cursor["model"]
-            if fields == []:
+            if not fields:
                 name = model_name.split(".", 1)
                 name = name[0].replace(".", "_")
-                fields = [{'name': 'New {}'.format(name.capitalize())}]
+                fields = {'name': 'New {}'.format(name.capitalize())}
             try:
-                new_record_id = model.execute_kw(cursor["db"], self.uid, self.password,
-                                        model_name, 'create', [fields])
+                new_record_id = self._execute_kw(cursor, model_name, 'create', [fields])
                 return {"error": None, "id": new_record_id}
             except Exception as err:
                 return {"error": repr(err), "id": None}
         return {"error": "Model name is required.", "id": None}
 
-    def update_record(self, model_name=None, ids=[], fields={}) -> dict:
+    def update_record(self, model_name=None, ids=None, fields=None, compare_before_write=False) -> dict:
         """
         Updates records of requested model using a list of records ids and 
         fields values provided as a dictionary of name-value pairs.
@@ -316,25 +963,31 @@ class odooExternalApiConnector:
         - ids:list - a list of records database identifiers. Default to empty list.
         - fields:dict - a dictionary of fields name - value pairs. 
           Default to empty dictionary.
+        - compare_before_write:bool - read current values of the fields first and
+          write only records which values differ. Returned list contains only
+          the records actually written. Default to False.
         """
         if model_name:
             cursor = self._check_model_access(model_name, ['read', 'write'])
             if cursor["error"]:
                 return {"error": cursor["error"], "ids": None}
-            model = cursor["model"]
-            if ids == []:
+            if not ids:
                 return {"error": "No records to update.", "ids": None}
-            if fields == {}:
+            if not fields:
                 return {"error": None, "ids": ids}
             try:
-                model.execute_kw(cursor["db"], self.uid, self.password,
-                                        model_name, 'write', [ids, fields])
+                if compare_before_write:
+                    records = self._execute_kw(cursor, model_name, 'read', [ids, list(fields)])
+                    ids = _changed_ids(records, fields)
+                    if not ids:
+                        return {"error": None, "ids": ids}
+                self._execute_kw(cursor, model_name, 'write', [ids, fields])
                 return {"error": None, "ids": ids}
             except Exception as err:
                 return {"error": repr(err), "ids": None}
         return {"error": "Model name is required.", "ids": None}
 
-    def delete_record(self, model_name=None, ids=[]) -> dict:
+    def delete_record(self, model_name=None, ids=None) -> dict:
         """
         Deletes records of requested model from a provided a list of records ids.
         Records can be deleted in bulk. 
@@ -348,18 +1001,16 @@ class odooExternalApiConnector:
             cursor = self._check_model_access(model_name, ['read', 'unlink'])
             if cursor["error"]:
                 return {"error": cursor["error"], "count": 0}
-            model = cursor["model"]
-            if ids == []:
+            if not ids:
                 return {"error": "No records to delete.", "count": 0}
             try:
-                model.execute_kw(cursor["db"], self.uid, self.password,
-                                        model_name, 'unlink', [ids])
+                self._execute_kw(cursor, model_name, 'unlink', [ids])
                 return {"error": None, "count": len(ids)}
             except Exception as err:
                 return {"error": repr(err), "count": 0}
         return {"error": "Model name is required.", "count": 0}
 
-    def create_model(self, model_name=None, fields=[]) -> dict:
+    def create_model(self, model_name=None, fields=None) -> dict:
         """
         Creates a new model. Returns the new model id:int as the second element 
         and error message, if any, as the first element of a dictionary.
@@ -371,76 +1022,399 @@ class odooExternalApiConnector:
           will be created. Required.
         - fields:list[dict] - a list of fields in a form of field's name-value 
           pairs dictionaries.
-        If an error occures when creating fileds provided the model will not be created.
+        The model and its fields are created in a single request, if an error occures
+        when creating fileds provided the model will not be created.
         Default field parameters:
         - 'state': 'manual' (required)
         - 'ttype': 'char'
         - 'name': 'x_<model_name.lower().replace(" ", "_")>_<field index in the list>'
         """
         if model_name:
-            cursor = self._check_model_access('ir.model', ['read', 'create', 'unlink'])
-            if cursor["error"]:
-                return {"error": cursor["error"], "id": None}
-            model = cursor["model"]
-            x_name = model_name
-            x_name = x_name.lower()
-            x_name = x_name.replace(" ", "_")
-            if not re.match('^(x_).+', x_name):
-                x_name = "x_" + x_name
+            if fields is None:
+                fields = []
             if not isinstance(fields, list):
                 return {"error": "Incorrect fields format. Should be a list of dictionaries.", "id": None}
+            if not all(isinstance(field, dict) for field in fields):
+                return {
+                    "error": "Wrong format of a field attributes. Should be dictionary of key-value pairs.", 
+                    "id": None
+                    }
+            x_name = _x_name(model_name.lower().replace(" ", "_"))
+            model_fields = [(0, 0, {
+                'state': 'manual',
+                'ttype': 'char',
+                **field,
+                'name': _x_name(field.get('name', "{}_field_{}".format(x_name, i))),
+                }) for i, field in enumerate(fields)]
+            cursor = self._check_model_access('ir.model', ['read', 'create'])
+            if cursor["error"]:
+                return {"error": cursor["error"], "id": None}
             try:
-                id = model.execute_kw(cursor["db"], self.uid, self.password, 
-                                        'ir.model', 'create', [{
-                                                        'name': model_name,
-                                                        'model': x_name,
-                                                        'state': 'manual',
-                                                    }]
-                                        )
+                id = self._execute_kw(cursor, 'ir.model', 'create', [{
+                                                    'name': model_name,
+                                                    'model': x_name,
+                                                    'state': 'manual',
+                                                    'field_id': model_fields,
+                                                }])
             except Exception as err:
                 return {"error": repr(err), "id": None}
             if not id:
                 return {"error": "The model was not created.", "id": None}
-            if fields != []:
-                for i, field in enumerate(fields):
-                    if not isinstance(field, dict):
-                        model.execute_kw(cursor["db"], self.uid, self.password,
-                                        'ir.model', 'unlink', [id])
-                        return {
-                            "error": "Wrong format of a field attributes. Should be dictionary of key-value pairs.", 
-                            "id": None
-                            }
-                    tmp_field = {
-                        'model_id': id, 
-                        'state': 'manual', 
-                        'ttype': 'char', 
-                        'name': "{}_field_{}".format(x_name, i)
-                        }
-                    if 'name' in field.keys():
-                        if not re.match('^(x_).+', field["name"]):
-                            field["name"] = "x_" + field["name"]
-                    tmp_field.update(field)
-                    fields[i] = tmp_field
-                try:
-                    model.execute_kw(
-                            cursor["db"], self.uid, self.password,
-                            'ir.model.fields', 'create', fields
-                            )
-                except Exception as err:
-                    model.execute_kw(cursor["db"], self.uid, self.password,
-                                        'ir.model', 'unlink', [id])
-                    return {"error": repr(err), "id": None}
             return {"error": None, "id": id}
         return {"error": "Model name is required.", "id": None}
 
 
+    async def _aauthenticate(self) -> dict:
+        """
+        Coroutine version of _authenticate(). Concurrent coroutines share
+        a single authentication in progress.
+        """
+        uid, db = self.uid, self._auth_db
+        if uid and db:
+            return {"error": None, "db": db, "uid": uid}
+        task = self._auth_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = self._auth_task = asyncio.ensure_future(self._aauthenticate_request())
+        #a cancelled caller must not cancel the authentication awaited by the others
+        return await asyncio.shield(task)
+
+    async def _aauthenticate_request(self) -> dict:
+        """
+        Authenticates on the Odoo server, see _aauthenticate(). Reuses UID
+        persisted in the token cache file like _authenticate().
+        """
+        if self._token_path:
+            db, uid = self._read_token()
+            if uid:
+                try:
+                    await _xmlrpc_call_async(self._object_url, 'execute_kw', (
+                        db, uid, self.password, 'res.users', 'read', [[uid], ['id']]))
+                except _RPC_ERRORS:
+                    pass
+                else:
+                    self.uid = uid
+                    self._auth_db = db
+                    return {"error": None, "db": db, "uid": uid}
+        connected_db = None
+        error = None
+        try:
+            if self.db:
+                self.uid = await _xmlrpc_call_async(self._common_url, 'authenticate',
+                                                    (self.db, self.username, self.password, {}))
+                connected_db = self.db
+            else:
+                dbs = await _xmlrpc_call_async(self._db_url, 'list', ())
+                if dbs:
+                    connected_db, uid, err = await self._authenticate_async(dbs)
+                    if connected_db:
+                        self.uid = uid
+                    elif err:
+                        error = "Can't connect to the database using credentials provided: {!r}".format(err)
+                    else:
+                        error = "Can't connect to the database using credentials provided."
+                else:
+                    error = "No database exists on the server."
+        except _RPC_ERRORS as err:
+            error = "Can't connect to the database using credentials provided: {!r}".format(err)
+
+        if error:
+            return {"error": error, "db": connected_db, "uid": None}
+
+        if self.uid:
+            self._auth_db = connected_db
+            if self._token_path:
+                self._save_token()
+        return {"error": None, "db": connected_db, "uid": self.uid}
+
+    async def _acheck_model_access(self, model_name:str, access_scope=('read',)) -> dict:
+        """
+        Coroutine version of _check_model_access(). Access rights of the scope
+        are checked concurrently. Returns database name and error if any.
+        """
+        auth = await self._aauthenticate()
+        if auth["error"]:
+            return {"error": auth["error"], "db": auth["db"]}
+        key = (model_name, tuple(access_scope))
+        if self._access_cached(key):
+            return {"error": None, "db": auth["db"], "uid": auth["uid"]}
+        try:
+            perm_checks = await asyncio.gather(*[
+                _xmlrpc_call_async(self._object_url, 'execute_kw', (
+                    auth["db"], auth["uid"], self.password, model_name,
+                    'check_access_rights', [access_right], {'raise_exception': False}))
+                for access_right in access_scope])
+        except xc.Fault:
+            return {"error": "Username/password are not valid.", "db": auth["db"]}
+        except _RPC_ERRORS as err:
+            return {"error": repr(err), "db": auth["db"]}
+        for access_right, perm_check in zip(access_scope, perm_checks):
+            if not perm_check:
+                return {
+                    "error": "The model does not exist or you do not have a permission to '{}' it.".format(access_right),
+                    "db": auth["db"]
+                    }
+        with self._lock:
+            self._perm_cache[key] = time.monotonic()
+        return {"error": None, "db": auth["db"], "uid": auth["uid"]}
+
+    async def _aexecute_kw(self, cursor:dict, model_name:str, method:str, args:list, kwargs=None):
+        """
+        Coroutine version of _execute_kw(). Each call is sent over its own
+        connection, so concurrent calls don't wait for each other.
+        """
+        params = [cursor["db"], cursor["uid"], self.password, model_name, method, args]
+        if kwargs is not None:
+            params.append(kwargs)
+        try:
+            return await _xmlrpc_call_async(self._object_url, 'execute_kw', tuple(params))
+        except xc.Fault as err:
+            if err.faultCode == _ACCESS_ERROR_FAULT:
+                self._drop_access_cache(model_name)
+            raise
+
+    async def aget_ids(self, model_name=None, filter=None, offset=0, limit=0) -> dict:
+        """
+        Coroutine version of get_ids().
+        """
+        if model_name:
+            cursor = await self._acheck_model_access(model_name)
+            if cursor["error"]:
+                return {"error": cursor["error"], "ids": None}
+            try:
+                ids = await self._aexecute_kw(cursor, model_name, 'search', [filter or []],
+                                              {'offset': offset, 'limit': limit})
+                return {"error": None, "ids": ids}
+            except Exception as err:
+                return {"error": repr(err), "ids": None}
+        return {"error": "Model name is required.", "ids": None}
+
+    async def aget_records(self, model_name=None, filter=None, offset=0, limit=0, fields=None) -> dict:
+        """
+        Coroutine version of get_records().
+        """
+        if model_name:
+            cursor = await self._acheck_model_access(model_name)
+            if cursor["error"]:
+                return {"error": cursor["error"], "records": None}
+            criteria = {'offset': offset, 'limit': limit}
+            if fields:
+                criteria['fields'] = fields
+            try:
+                records = await self._aexecute_kw(cursor, model_name, 'search_read', [filter or []],
+                                                  criteria)
+                return {"error": None, "records": records}
+            except Exception as err:
+                return {"error": repr(err), "records": None}
+        return {"error": "Model name is required.", "records": None}
+
+    async def aiter_records(self, model_name=None, filter=None, fields=None, page_size=1000) -> dict:
+        """
+        Coroutine version of iter_records(). Returned records are an asynchronous
+        generator, the next page is requested while the current one is consumed.
+        """
+        if model_name:
+            if not isinstance(page_size, int) or page_size < 1:
+                return {"error": "Page size should be a positive number.", "records": None}
+            cursor = await self._acheck_model_access(model_name)
+            if cursor["error"]:
+                return {"error": cursor["error"], "records": None}
+            return {"error": None, "records": self._aiter_pages(cursor, model_name, filter,
+                                                                fields, page_size)}
+        return {"error": "Model name is required.", "records": None}
+
+    async def _aiter_pages(self, cursor:dict, model_name:str, filter, fields, page_size:int):
+        """
+        Asynchronously yields records of the model requested page by page,
+        prefetching the next page.
+        """
+        criteria = {'limit': page_size, 'order': 'id'}
+        if fields:
+            criteria['fields'] = fields
+        offset = 0
+        next_page = asyncio.ensure_future(self._aexecute_kw(
+            cursor, model_name, 'search_read', [filter or []], dict(criteria, offset=offset)))
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                if len(page) == page_size:
+                    offset += page_size
+                    next_page = asyncio.ensure_future(self._aexecute_kw(
+                        cursor, model_name, 'search_read', [filter or []], dict(criteria, offset=offset)))
+                for record in page:
+                    yield record
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def aget_count(self, model_name=None, filter=None) -> dict:
+        """
+        Coroutine version of get_count().
+        """
+        if model_name:
+            cursor = await self._acheck_model_access(model_name)
+            if cursor["error"]:
+                return {"error": cursor["error"], "count": None}
+            try:
+                records_count = await self._aexecute_kw(cursor, model_name, 'search_count', [filter or []])
+                return {"error": None, "count": records_count}
+            except Exception as err:
+                return {"error": repr(err), "count": None}
+        return {"error": "Model name is required.", "count": None}
+
+    async def aget_fields(self, model_name=None, attributes=None) -> dict:
+        """
+        Coroutine version of get_fields().
+        """
+        if model_name:
+            cursor = await self._acheck_model_access(model_name)
+            if cursor["error"]:
+                return {"error": cursor["error"], "fields": None}
+            if attributes is None:
+                attributes = ['string', 'help', 'type']
+            try:
+                fields = await self._aexecute_kw(cursor, model_name, 'fields_get', [],
+                                                 {'attributes': attributes})
+                return {"error": None, "fields": fields}
+            except Exception as err:
+                return {"error": repr(err), "fields": None}
+        return {"error": "Model name is required.", "fields": None}
+
+    async def acreate_record(self, model_name=None, fields=None) -> dict:
+        """
+        Coroutine version of create_record().
+        """
+        if model_name:
+            cursor = await self._acheck_model_access(model_name, ['read', 'create'])
+            if cursor["error"]:
+                return {"error": cursor["error"], "id": None}
+            if not fields:
+                name = model_name.split(".", 1)
+                name = name[0].replace(".", "_")
+                fields = {'name': 'New {}'.format(name.capitalize())}
+            try:
+                new_record_id = await self._aexecute_kw(cursor, model_name, 'create', [fields])
+                return {"error": None, "id": new_record_id}
+            except Exception as err:
+                return {"error": repr(err), "id": None}
+        return {"error": "Model name is required.", "id": None}
+
+    async def aupdate_record(self, model_name=None, ids=None, fields=None, compare_before_write=False) -> dict:
+        """
+        Coroutine version of update_record().
+        """
+        if model_name:
+            cursor = await self._acheck_model_access(model_name, ['read', 'write'])
+            if cursor["error"]:
+                return {"error": cursor["error"], "ids": None}
+            if not ids:
+                return {"error": "No records to update.", "ids": None}
+            if not fields:
+                return {"error": None, "ids": ids}
+            try:
+                if compare_before_write:
+                    records = await self._aexecute_kw(cursor, model_name, 'read', [ids, list(fields)])
+                    ids = _changed_ids(records, fields)
+                    if not ids:
+                        return {"error": None, "ids": ids}
+                await self._aexecute_kw(cursor, model_name, 'write', [ids, fields])
+                return {"error": None, "ids": ids}
+            except Exception as err:
+                return {"error": repr(err), "ids": None}
+        return {"error": "Model name is required.", "ids": None}
+
+    async def adelete_record(self, model_name=None, ids=None) -> dict:
+        """
+        Coroutine version of delete_record().
+        """
+        if model_name:
+            cursor = await self._acheck_model_access(model_name, ['read', 'unlink'])
+            if cursor["error"]:
+                return {"error": cursor["error"], "count": 0}
+            if not ids:
+                return {"error": "No records to delete.", "count": 0}
+            try:
+                await self._aexecute_kw(cursor, model_name, 'unlink', [ids])
+                return {"error": None, "count": len(ids)}
+            except Exception as err:
+                return {"error": repr(err), "count": 0}
+        return {"error": "Model name is required.", "count": 0}
+
     def delete_model(self, model_name=None) -> dict:
         """TODO"""
         pass
 
 
-    def update_model(self, model_name=None, mode=None, fields=[]) -> dict:
+    def update_model(self, model_name=None, mode=None, fields=None) -> dict:
         """
         TODO
         """
         pass
+
+
+class OdooConnectorPool:
+    """
+    Thread-safe pool of authenticated odooExternalApiConnector instances. Callers
+    requesting the same server and credentials share one connector, so the
+    authentication is done once per pool lifetime instead of once per instance.
+    Every thread sends its calls over its own connection of the shared connector.
+    Parameters:     - max_size (optional[int]) - max number of connectors kept in the pool,
+                    the least recently used one is dropped when exceeded. Default to 32.
+    Methods:
+    OdooConnectorPool.get(self, url=None, db=None, username=None, password=None) -> dict
+    OdooConnectorPool.close_idle(self, ttl=300) -> int
+    """
+    def __init__(self, max_size=32) -> None:
+        #max number of connectors kept in the pool
+        self.max_size = max_size
+        #(url, db, username) -> [connector, time of the last use], least recently used first
+        self._connectors = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url=None, db=None, username=None, password=None) -> dict:
+        """
+        Returns an authenticated connector for provided server and credentials
+        as the second element and error message, if any, as the first element
+        of a dictionary. Parameters are the same as of odooExternalApiConnector.
+        """
+        key = (url, db, username)
+        with self._lock:
+            entry = self._connectors.get(key)
+            if entry is not None and entry[0].password == password:
+                entry[1] = time.monotonic()
+                self._connectors.move_to_end(key)
+                return {"error": None, "connector": entry[0]}
+        connector = odooExternalApiConnector(url=url, db=db, username=username, password=password)
+        auth = connector._authenticate()
+        if auth["error"] or not connector.uid:
+            connector.close()
+            return {"error": auth["error"] or "Username/password are not valid.", "connector": None}
+        dropped = []
+        with self._lock:
+            entry = self._connectors.get(key)
+            if entry is not None and entry[0].password == password:
+                #another thread has added a connector meanwhile
+                dropped.append(connector)
+                connector = entry[0]
+            elif entry is not None:
+                dropped.append(entry[0])
+            self._connectors[key] = [connector, time.monotonic()]
+            self._connectors.move_to_end(key)
+            while len(self._connectors) > self.max_size:
+                dropped.append(self._connectors.popitem(last=False)[1][0])
+        for old in dropped:
+            old.close()
+        return {"error": None, "connector": connector}
+
+    def close_idle(self, ttl=300) -> int:
+        """
+        Drops connectors not requested for more than ttl seconds. Returns
+        a number of dropped connectors.
+        """
+        expired = time.monotonic() - ttl
+        with self._lock:
+            idle = [key for key, entry in self._connectors.items() if entry[1] < expired]
+            dropped = [self._connectors.pop(key)[0] for key in idle]
+        for connector in dropped:
+            connector.close()
+        return len(dropped)